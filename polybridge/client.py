@@ -7,15 +7,68 @@ market identifiers or interval mappings.
 
 from __future__ import annotations
 
-from collections import defaultdict
+import asyncio
+import copy
+import functools
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Iterable, List, Optional, Sequence
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from polybridge.types import TimeseriesResult
 
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore[assignment]
+
+try:
+    import pyarrow as pa  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+try:
+    import orjson
+
+    def _loads(data: Union[bytes, str]) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity tokens json.dumps emits by default
+            return json.loads(data)
+
+    def _dumps(obj: object) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:  # pragma: no cover - optional dependency
+
+    def _loads(data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+    def _dumps(obj: object) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
 # Horizon to interval mapping for API calls
 HORIZON_INTERVAL_MAP: Dict[str, str] = {
     "daily": "5m",
@@ -27,6 +80,25 @@ HORIZON_INTERVAL_MAP: Dict[str, str] = {
 # Default API base URL
 DEFAULT_BASE_URL = "https://us-central1-polymarket-analytics-api.cloudfunctions.net"
 
+# Upper bound on concurrent chunk requests issued by fetch_timeseries
+DEFAULT_MAX_WORKERS = 8
+
+# Maximum number of market catalog responses kept in memory
+CATALOG_CACHE_SIZE = 128
+
+# Row count from which frame_backend="auto" builds frames through PyArrow
+PYARROW_MIN_ROWS = 1024
+
+FRAME_BACKENDS = ("auto", "numpy", "pyarrow")
+
+# datetime.fromisoformat accepts a trailing "Z" from Python 3.11 onwards
+FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+# Response blocks returned by api_v1_merged that are parsed into dataframes
+DATA_BLOCKS = ("probabilities", "prices", "options_metrics")
+
+_T = TypeVar("_T")
+
 
 class PolybridgeClient:
     """High-level client for the Polybridge analytics API.
@@ -58,6 +130,9 @@ class PolybridgeClient:
         base_url: str = DEFAULT_BASE_URL,
         timeout: int = 60,
         session: Optional[requests.Session] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        cache_ttl: float = 30.0,
+        timeseries_cache_size: int = 0,
     ) -> None:
         """Initialize the Polybridge client.
 
@@ -71,32 +146,101 @@ class PolybridgeClient:
             Request timeout in seconds (default: 60)
         session : requests.Session, optional
             Custom requests session for connection pooling
+        max_workers : int, optional
+            Maximum number of chunk requests issued concurrently (default: 8)
+        cache_ttl : float, optional
+            Seconds to reuse identical market catalog lookups and
+            fetch_timeseries results; 0 disables caching (default: 30)
+        timeseries_cache_size : int, optional
+            Number of fetch_timeseries results kept for reuse. Each one holds
+            a full copy of its dataframes, so 0 disables the timeseries cache
+            (default: 0)
         """
         if not api_key:
             raise ValueError("API key is required")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if timeseries_cache_size < 0:
+            raise ValueError("timeseries_cache_size must not be negative")
 
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-        self.session = session or requests.Session()
-        self.session.headers.update(
-            {
-                "X-API-Key": api_key,
-                "Content-Type": "application/json",
-            }
+        self.max_workers = max_workers
+        self.cache_ttl = cache_ttl
+        self.timeseries_cache_size = timeseries_cache_size
+        self._catalog_cache: OrderedDict[tuple, Tuple[float, Dict[str, object]]] = (
+            OrderedDict()
         )
+        self._ts_cache: OrderedDict[tuple, Tuple[float, TimeseriesResult]] = (
+            OrderedDict()
+        )
+        self._cache_lock = threading.Lock()
+        self._headers = {
+            "X-API-Key": api_key,
+            "Content-Type": "application/json",
+        }
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        if session is None:
+            session = requests.Session()
+            # Size the pool so concurrent chunk requests never wait on a connection,
+            # and retry transient failures on the same kept-alive connections
+            adapter = HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=32,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=frozenset(["POST"]),
+                    raise_on_status=False,
+                ),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+        self.session.headers.update(self._headers)
 
     # ------------------------------------------------------------------
     # Low-level helpers
     # ------------------------------------------------------------------
-    def _post(self, endpoint: str, payload: Dict[str, object]) -> Dict[str, object]:
-        """Make a POST request to the API."""
+    def _post(
+        self,
+        endpoint: str,
+        payload: Union[Dict[str, object], bytes],
+    ) -> Dict[str, object]:
+        """Make a POST request to the API.
+
+        ``payload`` may be a dict or an already JSON-encoded request body.
+        """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        response = self.session.post(url, json=payload, timeout=self.timeout)
+        body = payload if isinstance(payload, bytes) else _dumps(payload)
+        response = self.session.post(url, data=body, timeout=self.timeout)
+        if response.status_code < 300:
+            data: Dict[str, object] = _loads(response.content)
+            if "error" not in data:
+                return data
+        return self._post_diagnose(response)
+
+    def _post_diagnose(self, response: requests.Response) -> Dict[str, object]:
+        """Raise a descriptive error for a response that failed the fast path."""
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as exc:
+            error_detail = self._error_detail(response)
+            raise requests.HTTPError(
+                f"{exc} | {error_detail if error_detail else response.text[:500]}",
+                response=response,
+            ) from None
+
+        return self._check_data(_loads(response.content))
 
-        # Always try to extract error details from response
+    @staticmethod
+    def _error_detail(response: Union[requests.Response, "httpx.Response"]) -> str:
+        """Extract a readable error description from a response body."""
         error_detail = ""
         try:
-            error_data = response.json()
+            error_data = _loads(response.content)
             if "error" in error_data:
                 error_obj = error_data["error"]
                 if isinstance(error_obj, dict):
@@ -108,16 +252,11 @@ class PolybridgeClient:
         except Exception:
             # If JSON parsing fails, use raw text
             error_detail = response.text[:500]  # Limit length
+        return error_detail
 
-        try:
-            response.raise_for_status()
-        except requests.HTTPError as exc:
-            raise requests.HTTPError(
-                f"{exc} | {error_detail if error_detail else response.text[:500]}",
-                response=response,
-            ) from None
-
-        data = response.json()
+    @staticmethod
+    def _check_data(data: Dict[str, object]) -> Dict[str, object]:
+        """Raise if a successful response carries an API error payload."""
         if "error" in data:
             error_obj = data["error"]
             error_msg = (
@@ -128,6 +267,108 @@ class PolybridgeClient:
             raise RuntimeError(f"API returned error: {error_msg}")
         return data
 
+    def _post_many(
+        self,
+        endpoint: str,
+        payloads: Sequence[Union[Dict[str, object], bytes]],
+    ) -> List[Dict[str, object]]:
+        """POST several payloads concurrently, returning responses in payload order."""
+        if len(payloads) <= 1:
+            return [self._post(endpoint, payload) for payload in payloads]
+
+        workers = min(len(payloads), self.max_workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._post, endpoint, payload) for payload in payloads
+            ]
+            try:
+                return [future.result() for future in futures]
+            except BaseException:
+                # Don't send chunks still queued behind a failed one
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def _get_async_client(self) -> "httpx.AsyncClient":
+        """Return the HTTP/2 client for the running event loop.
+
+        Pooled connections belong to the loop that opened them, so the client
+        is recreated when called from a different loop (for example a second
+        ``asyncio.run``).
+        """
+        if httpx is None:
+            raise ImportError(
+                "Async methods require httpx; install with "
+                "`pip install polybridge-python-client[async]`"
+            )
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not None and self._async_loop is not loop:
+            # The previous loop may already be closed, so its client cannot be
+            # closed cleanly; drop it and let its connections be collected
+            self._async_client = None
+        self._async_loop = loop
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                headers=self._headers,
+                timeout=self.timeout,
+                http2=True,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            )
+        return self._async_client
+
+    async def _apost(
+        self, endpoint: str, payload: Union[Dict[str, object], bytes]
+    ) -> Dict[str, object]:
+        """Make a POST request to the API without blocking the event loop."""
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        body = payload if isinstance(payload, bytes) else _dumps(payload)
+        response = await self._get_async_client().post(url, content=body)
+        if response.status_code < 300:
+            data: Dict[str, object] = _loads(response.content)
+            if "error" not in data:
+                return data
+        return self._apost_diagnose(response)
+
+    def _apost_diagnose(self, response: httpx.Response) -> Dict[str, object]:
+        """Raise a descriptive error for an async response that failed the fast path."""
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            error_detail = self._error_detail(response)
+            raise httpx.HTTPStatusError(
+                f"{exc} | {error_detail if error_detail else response.text[:500]}",
+                request=exc.request,
+                response=response,
+            ) from None
+
+        return self._check_data(_loads(response.content))
+
+    async def _apost_many(
+        self, endpoint: str, payloads: Sequence[Union[Dict[str, object], bytes]]
+    ) -> List[Dict[str, object]]:
+        """POST several payloads concurrently, returning responses in payload order."""
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def post(payload: Union[Dict[str, object], bytes]) -> Dict[str, object]:
+            async with semaphore:
+                return await self._apost(endpoint, payload)
+
+        tasks = [asyncio.ensure_future(post(payload)) for payload in payloads]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            # Don't send chunks still waiting behind a failed one
+            for task in tasks:
+                task.cancel()
+            raise
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client used by the ``afetch_*`` methods."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_loop = None
+
     @staticmethod
     def _to_iso(dt: datetime) -> str:
         """Convert datetime to ISO 8601 format with Z suffix."""
@@ -143,16 +384,210 @@ class PolybridgeClient:
         """Parse ISO string to datetime or return fallback."""
         if value is None:
             return fallback
-        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        return PolybridgeClient._parse_iso(value)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _parse_iso(value: str) -> datetime:
+        """Parse an ISO 8601 string into a UTC datetime, naive values as UTC."""
+        if not FROMISOFORMAT_ACCEPTS_Z:
+            value = value.replace("Z", "+00:00")
+        parsed = datetime.fromisoformat(value)
         if parsed.tzinfo is None:
             parsed = parsed.replace(tzinfo=timezone.utc)
         return parsed.astimezone(timezone.utc)
 
     @staticmethod
-    def _chunk(sequence: Sequence[str], size: int) -> Iterable[List[str]]:
+    def _chunk(sequence: Sequence[str], size: int) -> Iterable[Sequence[str]]:
         """Split sequence into chunks of given size."""
         for index in range(0, len(sequence), size):
-            yield list(sequence[index : index + size])
+            yield sequence[index : index + size]
+
+    @staticmethod
+    def _catalog_cache_key(
+        assets: Optional[Sequence[str]],
+        horizons: Optional[Sequence[str]],
+        market_types: Optional[Sequence[str]],
+        start_ts: Optional[str],
+        end_ts: Optional[str],
+    ) -> tuple:
+        """Build a hashable cache key from catalog filters."""
+        return (
+            tuple(assets or ()),
+            tuple(horizons or ()),
+            tuple(market_types or ()),
+            start_ts,
+            end_ts,
+        )
+
+    @staticmethod
+    def _timeseries_cache_key(
+        asset: str,
+        horizons: Sequence[str],
+        market_types: Optional[Sequence[str]],
+        start_ts: Optional[str],
+        end_ts: Optional[str],
+        hours: float,
+        include_prices: bool,
+        include_open_interest: bool,
+        include_options_metrics: bool,
+        prices_instrument: str,
+        chunk_size: int,
+        include_probabilities: bool,
+        frame_backend: str,
+        return_raw: bool,
+    ) -> tuple:
+        """Build a hashable cache key from fetch_timeseries arguments."""
+        return (
+            asset,
+            tuple(horizons),
+            tuple(market_types or ()),
+            start_ts,
+            end_ts,
+            hours,
+            include_prices,
+            include_open_interest,
+            include_options_metrics,
+            prices_instrument,
+            chunk_size,
+            include_probabilities,
+            frame_backend,
+            return_raw,
+        )
+
+    @staticmethod
+    def _catalog_payload(
+        assets: Optional[Sequence[str]],
+        horizons: Optional[Sequence[str]],
+        market_types: Optional[Sequence[str]],
+        start_ts: Optional[str],
+        end_ts: Optional[str],
+    ) -> Dict[str, object]:
+        """Build the api_v1_market_catalog request body, omitting empty filters."""
+        as_list = PolybridgeClient._as_list
+        return {
+            key: value
+            for key, value in (
+                ("assets", as_list(assets)),
+                ("horizons", as_list(horizons)),
+                ("market_types", as_list(market_types)),
+                ("start_ts", start_ts),
+                ("end_ts", end_ts),
+            )
+            if value
+        }
+
+    @staticmethod
+    def _as_list(values: Optional[Sequence[str]]) -> Optional[List[str]]:
+        """Return values as a list, without copying when it already is one."""
+        if not values:
+            return None
+        return values if isinstance(values, list) else list(values)
+
+    def _cache_get(
+        self, cache: OrderedDict[tuple, Tuple[float, _T]], key: tuple
+    ) -> Optional[_T]:
+        """Return a cached value stored less than ``cache_ttl`` seconds ago."""
+        if self.cache_ttl <= 0:
+            return None
+        with self._cache_lock:
+            now = time.monotonic()
+            cached = cache.get(key)
+            if cached is None or now - cached[0] >= self.cache_ttl:
+                self._purge_expired(cache, now)
+                return None
+            cache.move_to_end(key)
+            return cached[1]
+
+    def _cache_put(
+        self,
+        cache: OrderedDict[tuple, Tuple[float, _T]],
+        key: tuple,
+        value: _T,
+        max_size: int,
+    ) -> None:
+        """Store a value, evicting expired and least recently used entries."""
+        if self.cache_ttl <= 0:
+            return
+        with self._cache_lock:
+            now = time.monotonic()
+            self._purge_expired(cache, now)
+            cache[key] = (now, value)
+            cache.move_to_end(key)
+            while len(cache) > max_size:
+                cache.popitem(last=False)
+
+    def _purge_expired(self, cache: OrderedDict, now: float) -> None:
+        """Drop entries stored ``cache_ttl`` or more seconds before ``now``.
+
+        Callers must hold ``_cache_lock``.
+        """
+        expired = [
+            key for key, (stored, _) in cache.items() if now - stored >= self.cache_ttl
+        ]
+        for key in expired:
+            del cache[key]
+
+    def _catalog_cache_get(self, key: tuple) -> Optional[Dict[str, object]]:
+        """Return a copy of a fresh cached catalog response, if any."""
+        cached = self._cache_get(self._catalog_cache, key)
+        if cached is None:
+            return None
+        return self._copy_catalog(cached)
+
+    def _catalog_cache_put(self, key: tuple, response: Dict[str, object]) -> None:
+        """Store a copy of a catalog response."""
+        self._cache_put(
+            self._catalog_cache, key, self._copy_catalog(response), CATALOG_CACHE_SIZE
+        )
+
+    @staticmethod
+    def _copy_catalog(response: Dict[str, object]) -> Dict[str, object]:
+        """Copy a catalog response along with its market list."""
+        copied = dict(response)
+        markets = response.get("markets")
+        if isinstance(markets, list):
+            copied["markets"] = list(markets)
+        return copied
+
+    def _ts_cache_get(self, key: tuple) -> Optional[TimeseriesResult]:
+        """Return a copy of a fresh cached timeseries result, if any."""
+        cached = self._cache_get(self._ts_cache, key)
+        if cached is None:
+            return None
+        return self._copy_result(cached)
+
+    def _ts_cache_put(self, key: tuple, result: TimeseriesResult) -> None:
+        """Store a copy of a timeseries result, if the timeseries cache is on."""
+        if self.cache_ttl <= 0 or self.timeseries_cache_size <= 0:
+            return
+        self._cache_put(
+            self._ts_cache, key, self._copy_result(result), self.timeseries_cache_size
+        )
+
+    @staticmethod
+    def _copy_result(result: TimeseriesResult) -> TimeseriesResult:
+        """Copy a result so callers cannot mutate a cached instance.
+
+        Frames are deep-copied: without copy-on-write, a shallow copy still
+        shares its column data with the cached frame.
+        """
+        return TimeseriesResult(
+            catalog=list(result.catalog),
+            responses=copy.deepcopy(result.responses),
+            dataframes={key: frame.copy() for key, frame in result.dataframes.items()},
+        )
+
+    def clear_catalog_cache(self) -> None:
+        """Drop all cached market catalog responses."""
+        with self._cache_lock:
+            self._catalog_cache.clear()
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached market catalog responses and timeseries results."""
+        with self._cache_lock:
+            self._catalog_cache.clear()
+            self._ts_cache.clear()
 
     # ------------------------------------------------------------------
     # Catalog & timeseries APIs
@@ -185,19 +620,53 @@ class PolybridgeClient:
         -------
         Dict[str, object]
             Response containing "markets" list with catalog entries
+
+        Notes
+        -----
+        Identical lookups within ``cache_ttl`` seconds are served from an
+        in-memory cache; use :meth:`clear_catalog_cache` to force a refresh.
+        """
+        cache_key = self._catalog_cache_key(
+            assets, horizons, market_types, start_ts, end_ts
+        )
+        cached = self._catalog_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        payload = self._catalog_payload(
+            assets, horizons, market_types, start_ts, end_ts
+        )
+        response = self._post("api_v1_market_catalog", payload)
+        self._catalog_cache_put(cache_key, response)
+        return response
+
+    async def afetch_market_catalog(
+        self,
+        *,
+        assets: Optional[Sequence[str]] = None,
+        horizons: Optional[Sequence[str]] = None,
+        market_types: Optional[Sequence[str]] = None,
+        start_ts: Optional[str] = None,
+        end_ts: Optional[str] = None,
+    ) -> Dict[str, object]:
+        """Asynchronous variant of :meth:`fetch_market_catalog`.
+
+        Requires the optional ``httpx`` dependency and shares the catalog
+        cache with the synchronous method.
         """
-        payload: Dict[str, object] = {}
-        if assets:
-            payload["assets"] = list(assets)
-        if horizons:
-            payload["horizons"] = list(horizons)
-        if market_types:
-            payload["market_types"] = list(market_types)
-        if start_ts:
-            payload["start_ts"] = start_ts
-        if end_ts:
-            payload["end_ts"] = end_ts
-        return self._post("api_v1_market_catalog", payload)
+        cache_key = self._catalog_cache_key(
+            assets, horizons, market_types, start_ts, end_ts
+        )
+        cached = self._catalog_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        payload = self._catalog_payload(
+            assets, horizons, market_types, start_ts, end_ts
+        )
+        response = await self._apost("api_v1_market_catalog", payload)
+        self._catalog_cache_put(cache_key, response)
+        return response
 
     def fetch_timeseries(
         self,
@@ -214,6 +683,9 @@ class PolybridgeClient:
         prices_instrument: str = "spot",
         chunk_size: int = 10,
         include_probabilities: bool = True,
+        frame_backend: str = "numpy",
+        return_raw: bool = False,
+        disable_cache: bool = False,
     ) -> TimeseriesResult:
         """Fetch timeseries data for an asset across multiple horizons.
 
@@ -246,14 +718,55 @@ class PolybridgeClient:
             Number of markets to request per API call (default: 10)
         include_probabilities : bool
             Include probability data (default: True)
+        frame_backend : str
+            How dataframes are built: "numpy" (pandas constructor), "pyarrow"
+            (Arrow-backed columns, requires pyarrow), or "auto" to use pyarrow
+            for blocks of at least 1024 rows when it is installed. Arrow is
+            best-effort: a block whose rows do not match its columns, or that
+            has a column Arrow cannot infer a type for, keeps NumPy dtypes.
+            Only "numpy" gives the same dtypes regardless of result size,
+            content, and installed packages (default: "numpy")
+        return_raw : bool
+            Also keep the merged raw API responses in ``result.responses``.
+            They duplicate the rows held in the dataframes, so by default
+            they are not built and ``result.responses`` is empty
+            (default: False)
+        disable_cache : bool
+            Always query the API instead of reusing a result from an identical
+            call made within ``cache_ttl`` seconds. Results are only cached
+            when the client has a ``timeseries_cache_size`` (default: False)
 
         Returns
         -------
         TimeseriesResult
-            Result containing catalog, raw responses, and parsed dataframes
+            Result containing catalog, raw responses (if requested), and
+            parsed dataframes
         """
         if not horizons:
             raise ValueError("At least one horizon must be provided")
+        self._check_frame_backend(frame_backend)
+
+        cache_key = None
+        if not disable_cache:
+            cache_key = self._timeseries_cache_key(
+                asset,
+                horizons,
+                market_types,
+                start_ts,
+                end_ts,
+                hours,
+                include_prices,
+                include_open_interest,
+                include_options_metrics,
+                prices_instrument,
+                chunk_size,
+                include_probabilities,
+                frame_backend,
+                return_raw,
+            )
+            cached = self._ts_cache_get(cache_key)
+            if cached is not None:
+                return cached
 
         end_dt = self._ensure_datetime(end_ts, fallback=datetime.now(timezone.utc))
         start_dt = self._ensure_datetime(
@@ -267,59 +780,270 @@ class PolybridgeClient:
             start_ts=self._to_iso(start_dt) if start_ts else None,
             end_ts=self._to_iso(end_dt) if end_ts else None,
         )
-        catalog = catalog_response.get("markets", [])
+        catalog = cast(List[Dict[str, object]], catalog_response.get("markets", []))
+        if not catalog:
+            return TimeseriesResult(catalog=[], responses={}, dataframes={})
+
+        payloads_by_interval = self._timeseries_payloads(
+            self._group_markets(catalog),
+            start_dt,
+            end_dt,
+            include_prices=include_prices,
+            include_open_interest=include_open_interest,
+            include_options_metrics=include_options_metrics,
+            prices_instrument=prices_instrument,
+            chunk_size=chunk_size,
+            include_probabilities=include_probabilities,
+        )
+        # Dispatch every interval's chunks through one pool, then regroup
+        responses = self._post_many(
+            "api_v1_merged",
+            [
+                payload
+                for payloads in payloads_by_interval.values()
+                for payload in payloads
+            ],
+        )
+        responses_by_interval = self._regroup_responses(payloads_by_interval, responses)
+        result = self._timeseries_result(
+            catalog,
+            responses_by_interval,
+            frame_backend=frame_backend,
+            return_raw=return_raw,
+        )
+        if cache_key is not None:
+            self._ts_cache_put(cache_key, result)
+        return result
+
+    async def afetch_timeseries(
+        self,
+        *,
+        asset: str,
+        horizons: Sequence[str],
+        market_types: Optional[Sequence[str]] = None,
+        start_ts: Optional[str] = None,
+        end_ts: Optional[str] = None,
+        hours: float = 6.0,
+        include_prices: bool = True,
+        include_open_interest: bool = True,
+        include_options_metrics: bool = False,
+        prices_instrument: str = "spot",
+        chunk_size: int = 10,
+        include_probabilities: bool = True,
+        frame_backend: str = "numpy",
+        return_raw: bool = False,
+        disable_cache: bool = False,
+    ) -> TimeseriesResult:
+        """Asynchronous variant of :meth:`fetch_timeseries`.
+
+        Chunk requests are multiplexed over a shared HTTP/2 connection, at
+        most ``max_workers`` at a time. Requires the optional ``httpx``
+        dependency (``pip install polybridge-python-client[async]``); call
+        :meth:`aclose` when done.
+
+        Unlike the synchronous session, the async client does not retry
+        failed requests: 429 and 5xx responses and connection errors are
+        raised immediately.
+
+        Parameters and return value are identical to :meth:`fetch_timeseries`.
+        """
+        if not horizons:
+            raise ValueError("At least one horizon must be provided")
+        self._check_frame_backend(frame_backend)
+
+        cache_key = None
+        if not disable_cache:
+            cache_key = self._timeseries_cache_key(
+                asset,
+                horizons,
+                market_types,
+                start_ts,
+                end_ts,
+                hours,
+                include_prices,
+                include_open_interest,
+                include_options_metrics,
+                prices_instrument,
+                chunk_size,
+                include_probabilities,
+                frame_backend,
+                return_raw,
+            )
+            cached = self._ts_cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+        end_dt = self._ensure_datetime(end_ts, fallback=datetime.now(timezone.utc))
+        start_dt = self._ensure_datetime(
+            start_ts, fallback=end_dt - timedelta(hours=hours)
+        )
+
+        catalog_response = await self.afetch_market_catalog(
+            assets=[asset],
+            horizons=horizons,
+            market_types=market_types,
+            start_ts=self._to_iso(start_dt) if start_ts else None,
+            end_ts=self._to_iso(end_dt) if end_ts else None,
+        )
+        catalog = cast(List[Dict[str, object]], catalog_response.get("markets", []))
         if not catalog:
             return TimeseriesResult(catalog=[], responses={}, dataframes={})
 
+        payloads_by_interval = self._timeseries_payloads(
+            self._group_markets(catalog),
+            start_dt,
+            end_dt,
+            include_prices=include_prices,
+            include_open_interest=include_open_interest,
+            include_options_metrics=include_options_metrics,
+            prices_instrument=prices_instrument,
+            chunk_size=chunk_size,
+            include_probabilities=include_probabilities,
+        )
+        responses = await self._apost_many(
+            "api_v1_merged",
+            [
+                payload
+                for payloads in payloads_by_interval.values()
+                for payload in payloads
+            ],
+        )
+        responses_by_interval = self._regroup_responses(payloads_by_interval, responses)
+        result = self._timeseries_result(
+            catalog,
+            responses_by_interval,
+            frame_backend=frame_backend,
+            return_raw=return_raw,
+        )
+        if cache_key is not None:
+            self._ts_cache_put(cache_key, result)
+        return result
+
+    @staticmethod
+    def _group_markets(catalog: Sequence[Dict[str, Any]]) -> Dict[str, List[str]]:
+        """Group catalog market identifiers by request interval."""
         markets_by_interval: Dict[str, List[str]] = defaultdict(list)
+        interval_for = HORIZON_INTERVAL_MAP.get
         for entry in catalog:
-            horizon = entry.get("horizon")
-            market_id = entry.get("market_id")
-            if not horizon or not market_id:
-                continue
-            interval = HORIZON_INTERVAL_MAP.get(horizon)
-            if interval:
+            interval = interval_for(entry.get("horizon", ""))
+            if interval and (market_id := entry.get("market_id")):
                 markets_by_interval[interval].append(market_id)
+        return markets_by_interval
 
-        merged_responses: Dict[str, Dict[str, object]] = {}
-        dataframes: Dict[str, pd.DataFrame] = {}
+    def _timeseries_payloads(
+        self,
+        markets_by_interval: Dict[str, List[str]],
+        start_dt: datetime,
+        end_dt: datetime,
+        *,
+        include_prices: bool,
+        include_open_interest: bool,
+        include_options_metrics: bool,
+        prices_instrument: str,
+        chunk_size: int,
+        include_probabilities: bool,
+    ) -> Dict[str, List[bytes]]:
+        """Build the chunked, JSON-encoded api_v1_merged bodies for each interval.
+
+        Everything except the market list is identical across an interval's
+        chunks, so it is encoded once and reused as a prefix for every body.
+        """
+        payloads_by_interval: Dict[str, List[bytes]] = {}
+        start_iso = self._to_iso(start_dt)
+        end_iso = self._to_iso(end_dt)
 
         for interval, market_ids in markets_by_interval.items():
-            unique_ids = sorted(set(market_ids))
+            unique_ids = list(dict.fromkeys(market_ids))
             if not unique_ids:
                 continue
 
-            aggregated: Dict[str, object] = {}
+            blocks: List[str] = []
+            template: Dict[str, object] = {
+                "interval": interval,
+                "start_ts": start_iso,
+                "end_ts": end_iso,
+                "blocks": blocks,
+            }
+
+            if include_probabilities:
+                blocks.append("probabilities")
 
-            for chunk in self._chunk(unique_ids, chunk_size):
-                payload: Dict[str, object] = {
-                    "markets": chunk,
-                    "interval": interval,
-                    "start_ts": self._to_iso(start_dt),
-                    "end_ts": self._to_iso(end_dt),
-                    "blocks": [],
+            if include_prices:
+                blocks.append("prices")
+                template["prices"] = {
+                    "instrument_type": prices_instrument,
+                    "include_open_interest": include_open_interest,
                 }
 
-                if include_probabilities:
-                    payload["blocks"].append("probabilities")
+            if include_options_metrics and interval == "1d":
+                blocks.append("options_metrics")
+
+            # Drop the closing brace so each chunk can append its market list
+            prefix = _dumps(template)[:-1] + b',"markets":'
+            payloads_by_interval[interval] = [
+                prefix + _dumps(chunk) + b"}"
+                for chunk in self._chunk(unique_ids, chunk_size)
+            ]
+
+        return payloads_by_interval
+
+    @staticmethod
+    def _regroup_responses(
+        payloads_by_interval: Dict[str, List[bytes]],
+        responses: Sequence[Dict[str, object]],
+    ) -> Dict[str, List[Dict[str, object]]]:
+        """Split responses to the flattened payload list back out by interval."""
+        responses_by_interval: Dict[str, List[Dict[str, object]]] = {}
+        offset = 0
+        for interval, payloads in payloads_by_interval.items():
+            responses_by_interval[interval] = list(
+                responses[offset : offset + len(payloads)]
+            )
+            offset += len(payloads)
+        return responses_by_interval
 
-                if include_prices:
-                    payload["blocks"].append("prices")
-                    payload["prices"] = {
-                        "instrument_type": prices_instrument,
-                        "include_open_interest": include_open_interest,
-                    }
+    def _timeseries_result(
+        self,
+        catalog: List[Dict[str, object]],
+        responses_by_interval: Dict[str, List[Dict[str, object]]],
+        *,
+        frame_backend: str = "numpy",
+        return_raw: bool = False,
+    ) -> TimeseriesResult:
+        """Collect per-chunk rows by block and build the result dataframes.
 
-                if include_options_metrics and interval == "1d":
-                    payload["blocks"].append("options_metrics")
+        Chunk rows are gathered in a single pass and only materialized once
+        per block; merged raw responses are built only when requested.
+        """
+        merged_responses: Dict[str, Dict[str, object]] = {}
+        dataframes: Dict[str, pd.DataFrame] = {}
 
-                response = self._post("api_v1_merged", payload)
-                aggregated = self._merge_responses(aggregated, response)
+        for interval, responses in responses_by_interval.items():
+            block_batches: Dict[str, List[List[object]]] = defaultdict(list)
+            block_columns: Dict[str, List[str]] = {}
+            for response in responses:
+                for block in DATA_BLOCKS:
+                    block_data = response.get(block)
+                    if isinstance(block_data, dict):
+                        block_batches[block].append(block_data.get("rows", []))
+                        # Empty chunks may omit column names; keep the first real ones
+                        columns = block_data.get("columns")
+                        if columns and block not in block_columns:
+                            block_columns[block] = columns
 
-            merged_responses[interval] = aggregated
+            if return_raw:
+                aggregated: Dict[str, object] = {}
+                for response in responses:
+                    aggregated = self._merge_responses(aggregated, response)
+                merged_responses[interval] = aggregated
 
-            for block, frame in self._response_to_frames(aggregated).items():
-                key = block if len(markets_by_interval) == 1 else f"{block}_{interval}"
+            frames = self._batches_to_frames(
+                block_columns, block_batches, frame_backend=frame_backend
+            )
+            for block, frame in frames.items():
+                key = (
+                    block if len(responses_by_interval) == 1 else f"{block}_{interval}"
+                )
                 dataframes[key] = frame
 
         return TimeseriesResult(
@@ -427,21 +1151,24 @@ class PolybridgeClient:
     def _merge_responses(
         destination: Dict[str, object], source: Dict[str, object]
     ) -> Dict[str, object]:
-        """Merge API responses from multiple chunks."""
-        if not destination:
-            return source
+        """Merge API responses from multiple chunks.
 
-        for block in ("probabilities", "prices", "options_metrics"):
-            if block not in source:
+        Rows are collected as one batch per chunk under ``row_batches`` and
+        only concatenated when frames are built.
+        """
+        for block in DATA_BLOCKS:
+            block_data = source.get(block)
+            if not isinstance(block_data, dict):
                 continue
-            block_data = source[block]
-            if block not in destination:
-                destination[block] = {
+            merged = destination.get(block)
+            if not isinstance(merged, dict):
+                merged = destination[block] = {
                     "columns": block_data.get("columns", []),
-                    "rows": list(block_data.get("rows", [])),
+                    "row_batches": [],
                 }
-            else:
-                destination[block]["rows"].extend(block_data.get("rows", []))
+            elif not merged["columns"]:
+                merged["columns"] = block_data.get("columns", [])
+            merged["row_batches"].append(block_data.get("rows", []))
 
         if "meta" in source:
             destination.setdefault("meta", source["meta"])
@@ -449,12 +1176,150 @@ class PolybridgeClient:
         return destination
 
     @staticmethod
-    def _response_to_frames(response: Dict[str, object]) -> Dict[str, pd.DataFrame]:
+    def _check_frame_backend(frame_backend: str) -> None:
+        """Validate a frame_backend option before any request is made."""
+        if frame_backend not in FRAME_BACKENDS:
+            raise ValueError(
+                f"frame_backend must be one of {', '.join(FRAME_BACKENDS)}; "
+                f"got {frame_backend!r}"
+            )
+        if frame_backend == "pyarrow" and pa is None:
+            raise ImportError(
+                'frame_backend="pyarrow" requires pyarrow; install with '
+                "`pip install polybridge-python-client[pyarrow]`"
+            )
+
+    @staticmethod
+    def _response_to_frames(
+        response: Dict[str, object], *, frame_backend: str = "numpy"
+    ) -> Dict[str, pd.DataFrame]:
         """Convert API response blocks to pandas DataFrames."""
+        block_columns: Dict[str, List[str]] = {}
+        block_batches: Dict[str, List[List[object]]] = {}
+        for block in DATA_BLOCKS:
+            block_data = response.get(block)
+            if isinstance(block_data, dict):
+                batches = block_data.get("row_batches")
+                if batches is None:
+                    batches = [block_data.get("rows", [])]
+                block_columns[block] = block_data.get("columns") or []
+                block_batches[block] = batches
+        return PolybridgeClient._batches_to_frames(
+            block_columns, block_batches, frame_backend=frame_backend
+        )
+
+    @staticmethod
+    def _batches_to_frames(
+        block_columns: Dict[str, List[str]],
+        block_batches: Dict[str, List[List[object]]],
+        *,
+        frame_backend: str = "numpy",
+    ) -> Dict[str, pd.DataFrame]:
+        """Build one DataFrame per block from its batches of chunk rows."""
         frames: Dict[str, pd.DataFrame] = {}
-        for block in ("probabilities", "prices", "options_metrics"):
-            if block in response and isinstance(response[block], dict):
-                rows = response[block].get("rows", [])
-                frames[block] = pd.DataFrame(rows) if rows else pd.DataFrame()
+        for block in DATA_BLOCKS:
+            if block in block_batches:
+                frames[block] = PolybridgeClient._normalize_dtypes(
+                    PolybridgeClient._rows_to_frame(
+                        block_columns.get(block) or [],
+                        [batch for batch in block_batches[block] if batch],
+                        frame_backend=frame_backend,
+                    )
+                )
         return frames
 
+    @staticmethod
+    def _normalize_dtypes(frame: pd.DataFrame) -> pd.DataFrame:
+        """Parse timestamp columns and unbox numeric object columns in place.
+
+        Columns named ``timestamp`` or ending in ``_ts`` become UTC datetimes.
+        Object columns holding only numbers are converted to a numeric dtype
+        without narrowing, so values keep full float64 precision.
+        """
+        for column in frame.columns:
+            series = frame[column]
+            if series.dtype != object and not pd.api.types.is_string_dtype(series):
+                continue
+            if column == "timestamp" or str(column).endswith("_ts"):
+                try:
+                    frame[column] = pd.to_datetime(
+                        series, format="ISO8601", utc=True, cache=True
+                    )
+                except (ValueError, TypeError):
+                    pass
+            elif series.dtype == object and pd.api.types.infer_dtype(
+                series, skipna=True
+            ) in ("integer", "floating", "mixed-integer-float"):
+                frame[column] = pd.to_numeric(series)
+        return frame
+
+    @staticmethod
+    def _flatten_batches(batches: Sequence[Sequence[Any]]) -> Sequence[Any]:
+        """Concatenate row batches into one list allocated at its final size."""
+        if len(batches) == 1:
+            return batches[0]
+
+        rows: List[object] = [None] * sum(len(batch) for batch in batches)
+        index = 0
+        for batch in batches:
+            rows[index : index + len(batch)] = batch
+            index += len(batch)
+        return rows
+
+    @staticmethod
+    def _rows_to_frame(
+        columns: Sequence[str],
+        batches: Sequence[Sequence[object]],
+        *,
+        frame_backend: str = "numpy",
+    ) -> pd.DataFrame:
+        """Build a DataFrame column-wise from batches of rows.
+
+        Rows may be lists aligned to ``columns`` or dicts keyed by column name.
+        Building each column directly avoids pandas' per-row record inference.
+        When rows do not match ``columns`` (short list rows, or a first dict
+        row with other keys), pandas builds the frame from the rows instead,
+        padding missing values and keeping extra keys.
+        With the pyarrow backend, columns are converted by Arrow and returned
+        as Arrow-backed pandas columns. Frames built from records, or with a
+        column Arrow cannot infer a type for, keep NumPy dtypes.
+        """
+        if not batches:
+            return pd.DataFrame()
+
+        rows = PolybridgeClient._flatten_batches(batches)
+        first_row = rows[0]
+        if (
+            columns
+            and isinstance(first_row, (list, tuple))
+            and len(first_row) == len(columns)
+        ):
+            try:
+                data = {
+                    column: [row[index] for row in rows]
+                    for index, column in enumerate(columns)
+                }
+            except IndexError:
+                return pd.DataFrame(rows)
+        elif (
+            columns and isinstance(first_row, dict) and first_row.keys() == set(columns)
+        ):
+            data = {column: [row.get(column) for row in rows] for column in columns}
+        else:
+            return pd.DataFrame(rows)
+
+        use_arrow = frame_backend == "pyarrow" or (
+            frame_backend == "auto" and pa is not None and len(rows) >= PYARROW_MIN_ROWS
+        )
+        if use_arrow:
+            try:
+                table = pa.Table.from_pydict(data)
+            except pa.ArrowException:
+                # Mixed-type columns Arrow cannot infer; use pandas instead
+                pass
+            else:
+                frame: pd.DataFrame = table.to_pandas(
+                    types_mapper=pd.ArrowDtype, self_destruct=True
+                )
+                return frame
+        return pd.DataFrame(data, copy=False)
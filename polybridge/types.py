@@ -15,7 +15,8 @@ class TimeseriesResult:
     catalog : List[Dict[str, object]]
         Market catalog entries matching the query
     responses : Dict[str, Dict[str, object]]
-        Raw API responses organized by interval
+        Raw API responses organized by interval; empty unless requested with
+        ``return_raw=True``
     dataframes : Dict[str, pd.DataFrame]
         Parsed pandas DataFrames for each data block
     """
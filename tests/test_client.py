@@ -1,5 +1,7 @@
 """Unit tests for PolybridgeClient."""
 
+import json
+
 import pytest
 from unittest.mock import Mock, patch
 
@@ -38,6 +40,14 @@ class TestPolybridgeClient:
         client = PolybridgeClient(api_key="test-key", session=custom_session)
         assert client.session is custom_session
 
+    def test_init_mounts_pooled_adapter(self):
+        """Test that the default session mounts a sized connection pool."""
+        client = PolybridgeClient(api_key="test-key")
+        adapter = client.session.get_adapter("https://example.com")
+        assert adapter._pool_maxsize == 32
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
+
     def test_to_iso(self):
         """Test datetime to ISO conversion."""
         from datetime import datetime, timezone
@@ -57,6 +67,17 @@ class TestPolybridgeClient:
         assert dt.month == 1
         assert dt.day == 1
 
+    def test_ensure_datetime_normalizes_to_utc(self):
+        """Test offsets are converted and naive strings are treated as UTC."""
+        from datetime import datetime, timezone
+
+        fallback = datetime.now(timezone.utc)
+        expected = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+        for value in ("2024-01-01T14:00:00+02:00", "2024-01-01T12:00:00"):
+            dt = PolybridgeClient._ensure_datetime(value, fallback=fallback)
+            assert dt == expected
+            assert dt.tzinfo == timezone.utc
+
     def test_ensure_datetime_with_none(self):
         """Test datetime fallback when value is None."""
         from datetime import datetime, timezone
@@ -70,12 +91,13 @@ class TestPolybridgeClient:
         sequence = ["a", "b", "c", "d", "e"]
         chunks = list(PolybridgeClient._chunk(sequence, 2))
         assert chunks == [["a", "b"], ["c", "d"], ["e"]]
+        assert list(PolybridgeClient._chunk(("a", "b", "c"), 2)) == [("a", "b"), ("c",)]
 
     @patch("polybridge.client.requests.Session")
     def test_post_success(self, mock_session_class):
         """Test successful POST request."""
         mock_response = Mock()
-        mock_response.json.return_value = {"data": "test"}
+        mock_response.content = b'{"data": "test"}'
         mock_response.raise_for_status = Mock()
         mock_response.status_code = 200
 
@@ -89,13 +111,15 @@ class TestPolybridgeClient:
 
         assert result == {"data": "test"}
         mock_session.post.assert_called_once()
+        assert mock_session.post.call_args.kwargs["data"] == b'{"key":"value"}'
 
     @patch("polybridge.client.requests.Session")
     def test_post_http_error(self, mock_session_class):
         """Test POST request with HTTP error."""
         mock_response = Mock()
-        mock_response.json.return_value = {}
+        mock_response.content = b"{}"
         mock_response.text = "Error message"
+        mock_response.status_code = 500
         mock_response.raise_for_status.side_effect = Exception("HTTP Error")
 
         mock_session = Mock()
@@ -107,6 +131,188 @@ class TestPolybridgeClient:
         with pytest.raises(Exception):
             client._post("test_endpoint", {})
 
+    @patch("polybridge.client.requests.Session")
+    def test_post_error_payload(self, mock_session_class):
+        """Test a successful status carrying an error payload raises."""
+        mock_response = Mock()
+        mock_response.content = b'{"error": {"message": "bad market"}}'
+        mock_response.status_code = 200
+        mock_response.raise_for_status = Mock()
+
+        mock_session = Mock()
+        mock_session.post.return_value = mock_response
+        mock_session.headers = {}
+        mock_session_class.return_value = mock_session
+
+        client = PolybridgeClient(api_key="test-key")
+        with pytest.raises(RuntimeError, match="bad market"):
+            client._post("test_endpoint", {})
+
+    @patch("polybridge.client.requests.Session")
+    def test_post_accepts_nan_tokens(self, mock_session_class):
+        """Test NaN and Infinity tokens decode as with the stdlib json module."""
+        import math
+
+        mock_response = Mock()
+        mock_response.content = b'{"iv": NaN, "rv": Infinity}'
+        mock_response.status_code = 200
+
+        mock_session = Mock()
+        mock_session.post.return_value = mock_response
+        mock_session.headers = {}
+        mock_session_class.return_value = mock_session
+
+        client = PolybridgeClient(api_key="test-key")
+        result = client._post("test_endpoint", {})
+        assert math.isnan(result["iv"])
+        assert result["rv"] == float("inf")
+
+    def test_post_many_preserves_order(self):
+        """Test concurrent POSTs return responses in payload order."""
+        client = PolybridgeClient(api_key="test-key", max_workers=4)
+        payloads = [{"markets": [str(i)]} for i in range(6)]
+        with patch.object(client, "_post", side_effect=lambda _, payload: payload) as mock_post:
+            responses = client._post_many("api_v1_merged", payloads)
+        assert responses == payloads
+        assert mock_post.call_count == 6
+
+    @patch("polybridge.client.ThreadPoolExecutor")
+    def test_post_many_cancels_pending_on_error(self, mock_executor_class):
+        """Test a failed chunk cancels the chunks not yet sent."""
+        futures = [Mock(), Mock(), Mock()]
+        futures[0].result.side_effect = RuntimeError("API returned error: boom")
+        executor = mock_executor_class.return_value.__enter__.return_value
+        executor.submit.side_effect = futures
+
+        client = PolybridgeClient(api_key="test-key")
+        with pytest.raises(RuntimeError, match="boom"):
+            client._post_many("api_v1_merged", [b"{}", b"{}", b"{}"])
+        for future in futures:
+            future.cancel.assert_called_once()
+        futures[1].result.assert_not_called()
+
+    def test_apost_many_cancels_pending_on_error(self):
+        """Test a failed async chunk cancels the chunks still in progress."""
+        import asyncio
+
+        client = PolybridgeClient(api_key="test-key", max_workers=2)
+        finished = []
+
+        async def fake_apost(endpoint, payload):
+            if payload == b"0":
+                raise RuntimeError("API returned error: boom")
+            await asyncio.sleep(1)
+            finished.append(payload)
+
+        async def run():
+            with patch.object(client, "_apost", side_effect=fake_apost):
+                with pytest.raises(RuntimeError, match="boom"):
+                    await client._apost_many("api_v1_merged", [b"0", b"1", b"2"])
+                await asyncio.sleep(0)
+            return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+        assert asyncio.run(run()) == []
+        assert finished == []
+
+    def test_async_client_recreated_per_event_loop(self):
+        """Test each event loop gets its own async client."""
+        import asyncio
+
+        pytest.importorskip("httpx")
+        client = PolybridgeClient(api_key="test-key")
+
+        async def get_client():
+            return client._get_async_client()
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+        assert first is not second
+        assert client._async_client is second
+
+    def test_fetch_market_catalog_uses_cache(self):
+        """Test repeated catalog lookups are served from the cache."""
+        client = PolybridgeClient(api_key="test-key")
+        response = {"markets": [{"market_id": "m1", "horizon": "daily"}]}
+        with patch.object(client, "_post", return_value=response) as mock_post:
+            first = client.fetch_market_catalog(assets=["BTC"], horizons=["daily"])
+            second = client.fetch_market_catalog(assets=("BTC",), horizons=["daily"])
+            client.clear_catalog_cache()
+            client.fetch_market_catalog(assets=["BTC"], horizons=["daily"])
+        assert first == second == response
+        assert second["markets"] is not response["markets"]
+        assert mock_post.call_count == 2
+
+    def test_catalog_payload_omits_empty_filters(self):
+        """Test catalog payload only carries provided filters."""
+        horizons = ["daily"]
+        payload = PolybridgeClient._catalog_payload(("BTC",), horizons, [], None, "2024-01-01")
+        assert payload == {"assets": ["BTC"], "horizons": ["daily"], "end_ts": "2024-01-01"}
+        assert payload["horizons"] is horizons
+
+    def test_fetch_market_catalog_cache_disabled(self):
+        """Test a zero cache TTL always hits the API."""
+        client = PolybridgeClient(api_key="test-key", cache_ttl=0)
+        with patch.object(client, "_post", return_value={"markets": []}) as mock_post:
+            client.fetch_market_catalog(assets=["BTC"])
+            client.fetch_market_catalog(assets=["BTC"])
+        assert mock_post.call_count == 2
+
+    def test_cache_drops_expired_entries(self):
+        """Test expired cache entries are purged rather than kept until evicted."""
+        client = PolybridgeClient(api_key="test-key", cache_ttl=30)
+        with patch.object(client, "_post", return_value={"markets": []}), patch(
+            "polybridge.client.time.monotonic", return_value=0.0
+        ) as mock_clock:
+            client.fetch_market_catalog(assets=["BTC"])
+            client.fetch_market_catalog(assets=["ETH"])
+            mock_clock.return_value = 31.0
+            client.fetch_market_catalog(assets=["SOL"])
+            assert len(client._catalog_cache) == 1
+
+            mock_clock.return_value = 62.0
+            assert client._catalog_cache_get(("missing",)) is None
+            assert not client._catalog_cache
+
+    def test_group_markets(self):
+        """Test catalog entries are grouped by interval and invalid ones skipped."""
+        catalog = [
+            {"market_id": "m1", "horizon": "daily"},
+            {"market_id": "w1", "horizon": "weekly"},
+            {"market_id": "", "horizon": "daily"},
+            {"market_id": "x1", "horizon": "hourly"},
+            {"market_id": "m2"},
+            {"market_id": "m3", "horizon": "daily"},
+        ]
+        grouped = PolybridgeClient._group_markets(catalog)
+        assert dict(grouped) == {"5m": ["m1", "m3"], "30m": ["w1"]}
+
+    def test_timeseries_payloads_share_encoded_prefix(self):
+        """Test chunk bodies decode to complete payloads."""
+        from datetime import datetime, timezone
+
+        client = PolybridgeClient(api_key="test-key")
+        payloads = client._timeseries_payloads(
+            {"5m": ["m1", "m2", "m1", "m3"]},
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+            datetime(2024, 1, 2, tzinfo=timezone.utc),
+            include_prices=True,
+            include_open_interest=False,
+            include_options_metrics=False,
+            prices_instrument="perp",
+            chunk_size=2,
+            include_probabilities=True,
+        )
+        bodies = [json.loads(body) for body in payloads["5m"]]
+        assert [body["markets"] for body in bodies] == [["m1", "m2"], ["m3"]]
+        assert bodies[1] == {
+            "interval": "5m",
+            "start_ts": "2024-01-01T00:00:00Z",
+            "end_ts": "2024-01-02T00:00:00Z",
+            "blocks": ["probabilities", "prices"],
+            "prices": {"instrument_type": "perp", "include_open_interest": False},
+            "markets": ["m3"],
+        }
+
     def test_merge_responses_empty_destination(self):
         """Test merging responses with empty destination."""
         source = {
@@ -114,18 +320,32 @@ class TestPolybridgeClient:
             "meta": {"key": "value"},
         }
         result = PolybridgeClient._merge_responses({}, source)
-        assert result == source
+        assert result == {
+            "probabilities": {"columns": ["col1"], "row_batches": [[{"col1": "value1"}]]},
+            "meta": {"key": "value"},
+        }
 
     def test_merge_responses_non_empty_destination(self):
         """Test merging responses with non-empty destination."""
-        destination = {
-            "probabilities": {"columns": ["col1"], "rows": [{"col1": "value1"}]},
-        }
+        destination = PolybridgeClient._merge_responses(
+            {}, {"probabilities": {"columns": ["col1"], "rows": [{"col1": "value1"}]}}
+        )
         source = {
             "probabilities": {"columns": ["col1"], "rows": [{"col1": "value2"}]},
         }
         result = PolybridgeClient._merge_responses(destination, source)
-        assert len(result["probabilities"]["rows"]) == 2
+        assert len(result["probabilities"]["row_batches"]) == 2
+
+    def test_timeseries_result_skips_empty_first_chunk_columns(self):
+        """Test an empty first chunk does not hide later chunks' column names."""
+        client = PolybridgeClient(api_key="test-key")
+        responses = [
+            {"probabilities": {"columns": [], "rows": []}},
+            {"probabilities": {"columns": ["market_id", "p"], "rows": [["m1", 0.5]]}},
+        ]
+        result = client._timeseries_result([], {"5m": responses}, return_raw=True)
+        assert list(result.dataframes["probabilities"].columns) == ["market_id", "p"]
+        assert result.responses["5m"]["probabilities"]["columns"] == ["market_id", "p"]
 
     def test_response_to_frames(self):
         """Test conversion of response to DataFrames."""
@@ -141,9 +361,252 @@ class TestPolybridgeClient:
         assert isinstance(frames["probabilities"], pd.DataFrame)
         assert len(frames["probabilities"]) == 2
 
+    def test_response_to_frames_concatenates_batches(self):
+        """Test row batches from several chunks become one frame."""
+        response = {
+            "probabilities": {
+                "columns": ["col1"],
+                "row_batches": [[{"col1": 1}], [], [{"col1": 2}, {"col1": 3}]],
+            },
+        }
+        frames = PolybridgeClient._response_to_frames(response)
+        assert frames["probabilities"]["col1"].tolist() == [1, 2, 3]
+        assert frames["probabilities"].index.tolist() == [0, 1, 2]
+
+    def test_flatten_batches(self):
+        """Test row batches are concatenated in order."""
+        batches = [[1, 2], [3], [4, 5, 6]]
+        assert PolybridgeClient._flatten_batches(batches) == [1, 2, 3, 4, 5, 6]
+        assert PolybridgeClient._flatten_batches([[1]]) == [1]
+
+    def test_response_to_frames_list_rows(self):
+        """Test rows given as lists aligned to columns."""
+        response = {
+            "prices": {
+                "columns": ["timestamp", "price"],
+                "row_batches": [[["t1", 100.0]], [["t2", 101.5]]],
+            },
+        }
+        frame = PolybridgeClient._response_to_frames(response)["prices"]
+        assert list(frame.columns) == ["timestamp", "price"]
+        assert frame["price"].tolist() == [100.0, 101.5]
+
+    def test_rows_to_frame_mismatched_rows(self):
+        """Test rows that do not match columns fall back to pandas record parsing."""
+        short = PolybridgeClient._rows_to_frame(["a", "b"], [[[1, 2], [3]]])
+        assert short.shape == (2, 2)
+        assert short.isna().sum().sum() == 1
+
+        extra = PolybridgeClient._rows_to_frame(["a"], [[{"a": 1, "b": 2}]])
+        assert extra.to_dict("records") == [{"a": 1, "b": 2}]
+
+    def test_response_to_frames_normalizes_dtypes(self):
+        """Test timestamp parsing and numeric unboxing of frame columns."""
+        import pandas as pd
+
+        response = {
+            "prices": {
+                "columns": ["timestamp", "price", "market_id"],
+                "rows": [
+                    ["2024-01-01T00:00:00Z", 1.5, "123"],
+                    ["2024-01-01T00:05:00Z", None, "456"],
+                ],
+            },
+        }
+        frame = PolybridgeClient._response_to_frames(response)["prices"]
+        assert str(frame["timestamp"].dt.tz) == "UTC"
+        assert frame["timestamp"].iloc[1] == pd.Timestamp("2024-01-01T00:05:00Z")
+        assert frame["market_id"].tolist() == ["123", "456"]
+
+        boxed = pd.DataFrame({"probability": pd.Series([0.1, None, 0.2], dtype=object)})
+        unboxed = PolybridgeClient._normalize_dtypes(boxed)["probability"]
+        assert unboxed.dtype == "float64"
+        assert unboxed[[0, 2]].tolist() == [0.1, 0.2]
+
+    def test_response_to_frames_pyarrow_backend(self):
+        """Test Arrow-backed frame construction."""
+        pytest.importorskip("pyarrow")
+        import pandas as pd
+
+        response = {"prices": {"columns": ["price"], "rows": [[1.5], [None]]}}
+        frame = PolybridgeClient._response_to_frames(response, frame_backend="pyarrow")
+        assert isinstance(frame["prices"]["price"].dtype, pd.ArrowDtype)
+        assert frame["prices"]["price"].isna().tolist() == [False, True]
+
+    def test_fetch_timeseries_invalid_frame_backend(self):
+        """Test an unknown frame backend is rejected before any request."""
+        client = PolybridgeClient(api_key="test-key")
+        with patch.object(client, "_post") as mock_post:
+            with pytest.raises(ValueError, match="frame_backend"):
+                client.fetch_timeseries(asset="BTC", horizons=["daily"], frame_backend="polars")
+        mock_post.assert_not_called()
+
     def test_fetch_timeseries_no_horizons(self):
         """Test fetch_timeseries with no horizons raises error."""
         client = PolybridgeClient(api_key="test-key")
         with pytest.raises(ValueError, match="At least one horizon must be provided"):
             client.fetch_timeseries(asset="BTC", horizons=[])
 
+    def test_fetch_timeseries_default_backend_is_numpy(self):
+        """Test large blocks keep NumPy dtypes unless Arrow is requested."""
+        import pandas as pd
+
+        catalog = {"markets": [{"market_id": "m1", "horizon": "daily"}]}
+        rows = [[float(i)] for i in range(2048)]
+        data = {"prices": {"columns": ["price"], "rows": rows}}
+
+        def fake_post(endpoint, payload, **kwargs):
+            return catalog if endpoint == "api_v1_market_catalog" else data
+
+        client = PolybridgeClient(api_key="test-key")
+        with patch.object(client, "_post", side_effect=fake_post):
+            result = client.fetch_timeseries(asset="BTC", horizons=["daily"])
+        assert not isinstance(result.dataframes["prices"]["price"].dtype, pd.ArrowDtype)
+        assert result.dataframes["prices"]["price"].dtype == "float64"
+
+    def test_fetch_timeseries_merges_chunks(self):
+        """Test fetch_timeseries groups markets and merges chunk responses."""
+        catalog = [
+            {"market_id": "m2", "horizon": "daily"},
+            {"market_id": "m1", "horizon": "daily"},
+            {"market_id": "m3", "horizon": "daily"},
+            {"market_id": "w1", "horizon": "weekly"},
+        ]
+
+        def fake_post(endpoint, payload, **kwargs):
+            if endpoint == "api_v1_market_catalog":
+                return {"markets": catalog}
+            payload = json.loads(payload)
+            rows = [[market_id, payload["interval"]] for market_id in payload["markets"]]
+            return {"probabilities": {"columns": ["market_id", "interval"], "rows": rows}}
+
+        client = PolybridgeClient(api_key="test-key")
+        with patch.object(client, "_post", side_effect=fake_post) as mock_post:
+            result = client.fetch_timeseries(
+                asset="BTC", horizons=["daily", "weekly"], include_prices=False, chunk_size=2
+            )
+        assert mock_post.call_count == 4
+        assert result.catalog == catalog
+        assert result.dataframes["probabilities_5m"]["market_id"].tolist() == ["m2", "m1", "m3"]
+        assert result.dataframes["probabilities_30m"]["interval"].tolist() == ["30m"]
+        assert result.responses == {}
+
+    def test_fetch_timeseries_dispatches_intervals_together(self):
+        """Test chunks for all intervals are posted in one concurrent batch."""
+        catalog = [
+            {"market_id": "m1", "horizon": "daily"},
+            {"market_id": "w1", "horizon": "weekly"},
+        ]
+        client = PolybridgeClient(api_key="test-key")
+        responses = [
+            {"prices": {"columns": ["v"], "rows": [["daily"]]}},
+            {"prices": {"columns": ["v"], "rows": [["weekly"]]}},
+        ]
+        with patch.object(client, "_post", return_value={"markets": catalog}), patch.object(
+            client, "_post_many", return_value=responses
+        ) as mock_post_many:
+            result = client.fetch_timeseries(asset="BTC", horizons=["daily", "weekly"])
+        mock_post_many.assert_called_once()
+        assert len(mock_post_many.call_args.args[1]) == 2
+        assert result.dataframes["prices_5m"]["v"].tolist() == ["daily"]
+        assert result.dataframes["prices_30m"]["v"].tolist() == ["weekly"]
+
+    def test_fetch_timeseries_return_raw(self):
+        """Test merged raw responses are kept only when requested."""
+        client = PolybridgeClient(api_key="test-key")
+        responses = [
+            {"markets": [{"market_id": "m1", "horizon": "daily"}]},
+            {"probabilities": {"columns": ["p"], "rows": [[0.5]]}, "meta": {"n": 1}},
+        ]
+        with patch.object(client, "_post", side_effect=responses):
+            result = client.fetch_timeseries(asset="BTC", horizons=["daily"], return_raw=True)
+        assert result.responses["5m"]["probabilities"]["row_batches"] == [[[0.5]]]
+        assert result.responses["5m"]["meta"] == {"n": 1}
+        assert result.dataframes["probabilities"]["p"].tolist() == [0.5]
+
+    def test_fetch_timeseries_uses_cache(self):
+        """Test identical fetches reuse the cached result until invalidated."""
+        client = PolybridgeClient(api_key="test-key", timeseries_cache_size=4)
+        catalog = {"markets": [{"market_id": "m1", "horizon": "daily"}]}
+        data = {"probabilities": {"columns": ["p"], "rows": [[0.5]]}}
+
+        def fake_post(endpoint, payload, **kwargs):
+            return catalog if endpoint == "api_v1_market_catalog" else data
+
+        kwargs = {"asset": "BTC", "horizons": ["daily"], "start_ts": "2024-01-01T00:00:00Z"}
+        with patch.object(client, "_post", side_effect=fake_post) as mock_post:
+            first = client.fetch_timeseries(**kwargs)
+            first.dataframes["probabilities"]["p"] = 1.0
+            second = client.fetch_timeseries(**kwargs)
+            assert mock_post.call_count == 2
+            assert second.dataframes["probabilities"]["p"].tolist() == [0.5]
+
+            client.fetch_timeseries(**kwargs, disable_cache=True)
+            assert mock_post.call_count == 3
+
+            client.invalidate_cache()
+            client.fetch_timeseries(**kwargs)
+            assert mock_post.call_count == 5
+
+    def test_fetch_timeseries_cache_survives_in_place_mutation(self):
+        """Test in-place edits to returned frames do not reach the cache."""
+        client = PolybridgeClient(api_key="test-key", timeseries_cache_size=4)
+        catalog = {"markets": [{"market_id": "m1", "horizon": "daily"}]}
+        data = {"probabilities": {"columns": ["p"], "rows": [[0.5], [0.25]]}}
+
+        def fake_post(endpoint, payload, **kwargs):
+            return catalog if endpoint == "api_v1_market_catalog" else data
+
+        kwargs = {"asset": "BTC", "horizons": ["daily"], "start_ts": "2024-01-01T00:00:00Z"}
+        with patch.object(client, "_post", side_effect=fake_post):
+            first = client.fetch_timeseries(**kwargs)
+            first.dataframes["probabilities"].loc[0, "p"] = 1.0
+            second = client.fetch_timeseries(**kwargs)
+            second.dataframes["probabilities"].loc[1, "p"] = 1.0
+            third = client.fetch_timeseries(**kwargs)
+        assert third.dataframes["probabilities"]["p"].tolist() == [0.5, 0.25]
+
+    def test_fetch_timeseries_cache_off_by_default(self):
+        """Test timeseries results are not cached without a cache size."""
+        client = PolybridgeClient(api_key="test-key")
+        catalog = {"markets": [{"market_id": "m1", "horizon": "daily"}]}
+        data = {"probabilities": {"columns": ["p"], "rows": [[0.5]]}}
+
+        def fake_post(endpoint, payload, **kwargs):
+            return catalog if endpoint == "api_v1_market_catalog" else data
+
+        kwargs = {"asset": "BTC", "horizons": ["daily"], "start_ts": "2024-01-01T00:00:00Z"}
+        with patch.object(client, "_post", side_effect=fake_post) as mock_post:
+            client.fetch_timeseries(**kwargs)
+            client.fetch_timeseries(**kwargs)
+        assert mock_post.call_count == 3
+        assert not client._ts_cache
+
+    def test_afetch_timeseries(self):
+        """Test the async fetch merges chunk responses like the sync path."""
+        import asyncio
+
+        httpx = pytest.importorskip("httpx")
+
+        def handler(request):
+            body = json.loads(request.content)
+            if request.url.path.endswith("api_v1_market_catalog"):
+                markets = [{"market_id": f"m{i}", "horizon": "daily"} for i in range(3)]
+                return httpx.Response(200, json={"markets": markets})
+            rows = [{"market_id": market_id} for market_id in body["markets"]]
+            return httpx.Response(200, json={"probabilities": {"rows": rows}})
+
+        client = PolybridgeClient(api_key="test-key")
+        client._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        async def run():
+            try:
+                return await client.afetch_timeseries(
+                    asset="BTC", horizons=["daily"], include_prices=False, chunk_size=2
+                )
+            finally:
+                await client.aclose()
+
+        result = asyncio.run(run())
+        assert result.dataframes["probabilities"]["market_id"].tolist() == ["m0", "m1", "m2"]
+        assert client._async_client is None